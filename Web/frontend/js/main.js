@@ -5,6 +5,12 @@ const STATUS_MAP = {
     3: 'Empty'     // Hijau
 };
 
+// Pemetaan ID zona backend (data/seat_zones.json: a1-a3 / b1-b3) ke ID
+// kursi di peta: baris atas = T1-T3, baris bawah = B1-B3
+const SEAT_ID_ALIAS = {
+    'A1': 'T1', 'A2': 'T2', 'A3': 'T3'
+};
+
 // State global
 let currentSelectedChair = null; // Element HTML kursi yang dipilih
 let currentSelectedSeat = null;  // Data object kursi yang dipilih
@@ -100,8 +106,10 @@ function processBackendData(jsonObject) {
             const statusCode = statusCodes[seatId];
             const statusString = STATUS_MAP[statusCode];
             if (statusString) {
+                // Samakan ID backend dengan ID kursi di peta
+                const upperId = seatId.toUpperCase();
                 seatArray.push({
-                    id: seatId.toUpperCase(),
+                    id: SEAT_ID_ALIAS[upperId] || upperId,
                     status: statusString
                 });
             }
@@ -182,16 +190,15 @@ function addLogEntry(seatId, timestamp, oldStatus, newStatus) {
 // Langkah Update Per Detik
 // ===================== LOGIC UPDATE PER DETIK =====================
 
-function runUpdateStep() {
-    // 1. Ambil data frame simulasi saat ini
-    const currentFrame = simulationData[currentIndex];
-    
-    // 2. Olah data
-    const processed = processBackendData(currentFrame);
+// Terapkan satu frame {timestamp, status_codes} -- dipakai oleh mode
+// simulasi maupun data live dari backend (event 'status_update')
+function applyFrame(frameObject) {
+    // 1. Olah data
+    const processed = processBackendData(frameObject);
     const newSeatArray = processed.seatArray;
     const newTimestamp = processed.timestamp;
 
-    // 3. CEK PERUBAHAN STATUS & UPDATE LOG
+    // 2. CEK PERUBAHAN STATUS & UPDATE LOG
     newSeatArray.forEach(newSeat => {
         // Cari status lama kursi ini di array global
         const oldSeat = currentSeats.find(s => s.id === newSeat.id);
@@ -199,36 +206,49 @@ function runUpdateStep() {
         if (oldSeat) {
             // Jika status berubah
             if (oldSeat.status !== newSeat.status) {
-                
+
                 // --- FILTER LOGIKA BARU ---
                 // Hanya catat log jika status BARU adalah 'Occupied' (Merah)
                 if (newSeat.status === 'Occupied') {
                     addLogEntry(newSeat.id, newTimestamp, oldSeat.status, newSeat.status);
                 }
-                
+
             }
         }
     });
 
-    // 4. Update Global State
+    // 3. Update Global State
     currentSeats = newSeatArray;
     lastTimestamp = newTimestamp;
 
-    // 5. Update Tampilan
+    // 4. Update Tampilan
     updateSummaryCards(currentSeats, lastTimestamp);
     renderSeatMap(currentSeats);
+}
 
-    // 6. Maju ke frame berikutnya
-    currentIndex++; 
-    
-    // 7. Looping jika data habis
+function runUpdateStep() {
+    // 1. Terapkan data frame simulasi saat ini
+    applyFrame(simulationData[currentIndex]);
+
+    // 2. Maju ke frame berikutnya
+    currentIndex++;
+
+    // 3. Looping jika data habis
     if (currentIndex >= simulationData.length) {
-        currentIndex = 0; 
+        currentIndex = 0;
+    }
+}
+
+function stopSimulationLoop() {
+    if (simulationInterval) {
+        clearInterval(simulationInterval);
+        simulationInterval = null;
     }
 }
 
 function startSimulationLoop() {
     if (!simulationData || simulationData.length === 0) return;
+    if (liveMode) return; // backend live sudah mengirim data
 
     // Load frame pertama (tanpa log karena belum ada perbandingan)
     const firstFrame = simulationData[0];
@@ -250,18 +270,52 @@ function startSimulationLoop() {
 }
 
 
+// ===================== LOGIC LIVE BACKEND (Socket.IO) =====================
+
+let liveMode = false;
+
+function initLiveConnection() {
+    // Library socket.io dimuat dari CDN di index.html; jika tidak
+    // tersedia (offline / server statis), dashboard tetap jalan dengan
+    // mode simulasi
+    if (typeof io === 'undefined') {
+        console.log('Socket.IO tidak tersedia, mode simulasi.');
+        return;
+    }
+
+    const socket = io();
+
+    // Payload run_server.py: { timestamp, status_codes, occupied, total_seats }
+    // -- bentuknya sama dengan satu frame simulasi
+    socket.on('status_update', (payload) => {
+        if (!liveMode) {
+            liveMode = true;
+            stopSimulationLoop();
+            console.log('Terhubung ke backend, mode live aktif.');
+        }
+        applyFrame(payload);
+    });
+
+    socket.on('disconnect', () => {
+        console.log('Koneksi backend terputus.');
+    });
+}
+
+
 // ===================== INISIALISASI PROGRAM =====================
 
 document.addEventListener('DOMContentLoaded', () => {
     resetSeatDetails();
+    initLiveConnection();
 
-    // Fetch File JSON
+    // Fetch File JSON (fallback simulasi selama belum ada data live)
     fetch('data/status_simulasi.json')
         .then(response => {
             if (!response.ok) throw new Error("Gagal load JSON");
             return response.json();
         })
         .then(data => {
+            if (liveMode) return; // backend sudah mengambil alih
             if (Array.isArray(data)) {
                 // Mode Simulasi (Array)
                 simulationData = data;
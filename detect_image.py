@@ -6,7 +6,8 @@ from src.utils import *
 from src.config import *
 
 
-def main(image_path, seat_zones_path=SEAT_ZONES_PATH, output_dir=OUTPUT_DIR):
+def main(image_path, seat_zones_path=SEAT_ZONES_PATH, output_dir=OUTPUT_DIR,
+         precision='fp32'):
     """Main detection pipeline for single image"""
     
     # Create output directories
@@ -28,9 +29,10 @@ def main(image_path, seat_zones_path=SEAT_ZONES_PATH, output_dir=OUTPUT_DIR):
     seat_zones = load_seat_zones(seat_zones_path)
     print(f"✓ Loaded {len(seat_zones)} seat zones: {list(seat_zones.keys())}")
     
-    # Initialize detector
+    # Initialize detector (fp16/int8 use a cached TensorRT engine)
     print("\nInitializing detector...")
-    detector = SeatDetector()
+    detector = SeatDetector(use_tensorrt=(precision != 'fp32'),
+                            precision=precision)
     
     # Process image
     print("\nRunning detection...")
@@ -76,7 +78,10 @@ if __name__ == "__main__":
                         help='Path to seat zones JSON file')
     parser.add_argument('--output', type=str, default=OUTPUT_DIR,
                         help='Output directory')
-    
+    parser.add_argument('--precision', type=str, default='fp32',
+                        choices=['fp32', 'fp16', 'int8'],
+                        help='Inference precision (fp16/int8 need TensorRT)')
+
     args = parser.parse_args()
-    
-    main(args.image, args.zones, args.output)
\ No newline at end of file
+
+    main(args.image, args.zones, args.output, args.precision)
\ No newline at end of file
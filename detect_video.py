@@ -0,0 +1,269 @@
+import cv2
+import math
+import time
+import queue
+import argparse
+import threading
+from pathlib import Path
+from src.detector import SeatDetector
+from src.utils import *
+from src.config import *
+
+
+def open_video_writer(output_path, fps, size):
+    """
+    Open the annotated-video writer, preferring NVENC hardware encode
+    via GStreamer (encode runs on the GPU's encoder block, fully
+    concurrent with inference). Falls back to software mp4v when OpenCV
+    has no GStreamer support or no NVENC device is present.
+    """
+    gst_pipeline = (
+        f"appsrc ! videoconvert ! nvh264enc bitrate=4000 ! h264parse ! "
+        f"mp4mux ! filesink location={output_path}"
+    )
+    writer = cv2.VideoWriter(gst_pipeline, cv2.CAP_GSTREAMER, 0, fps, size)
+    if writer.isOpened():
+        print("✓ Using NVENC hardware encoder")
+        return writer
+
+    fourcc = cv2.VideoWriter_fourcc(*'mp4v')
+    return cv2.VideoWriter(str(output_path), fourcc, fps, size)
+
+
+def main(video_path, seat_zones_path=SEAT_ZONES_PATH, skip_frames=1,
+         display=True, save_video=True, precision='fp32', batch_size=1,
+         adaptive_skip=False):
+    """Main detection pipeline for video files"""
+
+    # Create output directories
+    create_output_directories()
+
+    # Open video
+    print(f"\nOpening video: {video_path}")
+    cap = cv2.VideoCapture(video_path)
+
+    if not cap.isOpened():
+        print(f"✗ Error: Could not open video {video_path}")
+        return
+
+    fps = cap.get(cv2.CAP_PROP_FPS) or 30.0
+    width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+    height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+    total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+    print(f"✓ Video opened: {width}x{height} @ {fps:.1f} FPS, {total_frames} frames")
+
+    # Load seat zones
+    print(f"\nLoading seat zones: {seat_zones_path}")
+    seat_zones = load_seat_zones(seat_zones_path)
+    print(f"✓ Loaded {len(seat_zones)} seat zones: {list(seat_zones.keys())}")
+
+    # Initialize detector
+    print("\nInitializing detector...")
+    detector = SeatDetector(use_tensorrt=(precision != 'fp32'),
+                            precision=precision)
+
+    # Setup video writer
+    video_writer = None
+    output_path = None
+    if save_video:
+        output_path = Path(ANNOTATED_VIDEO_DIR) / f"{Path(video_path).stem}_annotated.mp4"
+        video_writer = open_video_writer(output_path, fps, (width, height))
+        print(f"✓ Output video: {output_path}")
+
+    if display:
+        cv2.namedWindow('Library Seat Detection - Video', cv2.WINDOW_NORMAL)
+
+    # Three-stage pipeline on dedicated threads, connected by small
+    # bounded queues: capture -> inference -> visualize/write/display.
+    # Decode, YOLO, and encode then overlap instead of running serially;
+    # maxsize=2 bounds memory and applies backpressure to the reader.
+    frame_q = queue.Queue(maxsize=2)
+    result_q = queue.Queue(maxsize=2)
+    stop_event = threading.Event()
+    processed_counter = [0]
+
+    def capture_worker():
+        count = 0
+        # The sentinel must go out even if the worker dies unexpectedly,
+        # or the consumer blocks forever in queue.get()
+        try:
+            while not stop_event.is_set():
+                ret, frame = cap.read()
+                if not ret:
+                    break
+                count += 1
+                frame_q.put((count, frame))
+        finally:
+            frame_q.put(None)  # end-of-stream sentinel
+
+    # Adaptive skip: EWMA of inference latency decides how many source
+    # frames one inference "costs", re-evaluated every 30 processed frames
+    ema_latency = [0.0]
+
+    def adapt_skip(dt, current_skip):
+        ema_latency[0] = (dt if ema_latency[0] == 0
+                          else 0.9 * ema_latency[0] + 0.1 * dt)
+        if processed_counter[0] % 30 != 0:
+            return current_skip
+        new_skip = max(1, math.ceil(ema_latency[0] * fps))
+        if new_skip != current_skip:
+            print(f"  Adaptive skip: {current_skip} -> {new_skip} "
+                  f"(inference {ema_latency[0] * 1000:.0f} ms)")
+        return new_skip
+
+    def infer_worker():
+        nonlocal skip_frames
+        last_detections, last_statuses = [], {}
+        # Batch mode: frames waiting on the next flush, in display order
+        pending = []
+        infer_frames = []
+
+        def flush_batch():
+            nonlocal last_detections, last_statuses
+            if infer_frames:
+                results = detector.process_batch(infer_frames, seat_zones)
+                processed_counter[0] += len(infer_frames)
+            else:
+                results = []
+            r = 0
+            for idx, frame, needs_infer in pending:
+                if needs_infer:
+                    last_detections, last_statuses = results[r]
+                    r += 1
+                result_q.put((idx, frame, last_detections, last_statuses))
+            pending.clear()
+            infer_frames.clear()
+
+        try:
+            while True:
+                item = frame_q.get()
+                if item is None:
+                    if batch_size > 1:
+                        flush_batch()  # partial batch at end-of-stream
+                    break
+                idx, frame = item
+                # Run detection on every Nth frame, reuse last result otherwise
+                needs_infer = (idx - 1) % skip_frames == 0
+
+                if batch_size <= 1:
+                    if needs_infer:
+                        t_before = time.time()
+                        last_detections, last_statuses = detector.process_image(frame, seat_zones)
+                        processed_counter[0] += 1
+                        if adaptive_skip:
+                            skip_frames = adapt_skip(time.time() - t_before,
+                                                     skip_frames)
+                    result_q.put((idx, frame, last_detections, last_statuses))
+                else:
+                    # Accumulate until batch_size frames need inference, then
+                    # run one forward pass for all of them
+                    pending.append((idx, frame, needs_infer))
+                    if needs_infer:
+                        infer_frames.append(frame)
+                    if len(infer_frames) >= batch_size:
+                        flush_batch()
+        finally:
+            result_q.put(None)  # always unblock the display loop
+
+    threading.Thread(target=capture_worker, daemon=True).start()
+    threading.Thread(target=infer_worker, daemon=True).start()
+
+    frame_count = 0
+    paused = False
+    stopped = False
+    start_time = time.time()
+    zone_overlay = SeatZoneOverlay(seat_zones)
+
+    print("\nProcessing video... ('q' = quit, 'p' = pause)")
+
+    while not stopped:
+        item = result_q.get()
+        if item is None:
+            break
+
+        frame_count, frame, detections, statuses = item
+        # Draw in-place: the pipeline hands us ownership of the frame
+        vis_frame = visualize_results(frame, seat_zones, statuses, detections,
+                                      out=frame, overlay=zone_overlay)
+
+        if video_writer is not None:
+            video_writer.write(vis_frame)
+
+        if display:
+            cv2.imshow('Library Seat Detection - Video', vis_frame)
+            key = cv2.waitKey(1) & 0xFF
+            if key == ord('q'):
+                print("\n✓ Stopped by user")
+                stopped = True
+            elif key == ord('p'):
+                paused = True
+                while paused:
+                    key = cv2.waitKey(100) & 0xFF
+                    if key == ord('p'):
+                        paused = False
+                    elif key == ord('q'):
+                        paused = False
+                        stopped = True
+
+        # Progress update every 30 frames
+        if frame_count % 30 == 0:
+            elapsed = time.time() - start_time
+            current_fps = frame_count / elapsed if elapsed > 0 else 0
+            print(f"  Frame {frame_count}/{total_frames} "
+                  f"({100 * frame_count / max(total_frames, 1):.1f}%) - "
+                  f"{current_fps:.1f} FPS")
+
+    # Cleanup (drain queues so worker threads can exit)
+    stop_event.set()
+    for q in (frame_q, result_q):
+        while not q.empty():
+            try:
+                q.get_nowait()
+            except queue.Empty:
+                break
+    cap.release()
+    if video_writer is not None:
+        video_writer.release()
+    cv2.destroyAllWindows()
+
+    # Final statistics
+    elapsed = time.time() - start_time
+    print("\n" + "=" * 60)
+    print("        VIDEO PROCESSING COMPLETE")
+    print("=" * 60)
+    print(f"Frames read:      {frame_count}")
+    print(f"Frames processed: {processed_counter[0]}")
+    print(f"Total time:       {elapsed:.1f}s ({frame_count / max(elapsed, 1e-6):.1f} FPS)")
+    if output_path is not None:
+        print(f"Output saved:     {output_path}")
+    print("=" * 60 + "\n")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Library Seat Detection - Video')
+    parser.add_argument('--video', type=str, required=True,
+                        help='Path to input video file')
+    parser.add_argument('--zones', type=str, default=SEAT_ZONES_PATH,
+                        help='Path to seat zones JSON file')
+    parser.add_argument('--skip-frames', type=int, default=1,
+                        help='Process every Nth frame (default: 1)')
+    parser.add_argument('--no-display', action='store_true',
+                        help="Don't show video during processing")
+    parser.add_argument('--no-save', action='store_true',
+                        help="Don't save annotated video")
+    parser.add_argument('--precision', type=str, default='fp32',
+                        choices=['fp32', 'fp16', 'int8'],
+                        help='Inference precision (fp16/int8 need TensorRT)')
+    parser.add_argument('--batch-size', type=int, default=BATCH_SIZE,
+                        help='Frames per YOLO forward pass (higher = better '
+                             'GPU utilization, more latency; video only)')
+    parser.add_argument('--adaptive-skip', action='store_true',
+                        help='Adjust --skip-frames automatically from '
+                             'measured inference latency')
+
+    args = parser.parse_args()
+
+    main(args.video, args.zones, args.skip_frames,
+         display=not args.no_display, save_video=not args.no_save,
+         precision=args.precision, batch_size=args.batch_size,
+         adaptive_skip=args.adaptive_skip)
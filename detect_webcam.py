@@ -0,0 +1,328 @@
+import cv2
+import json
+import math
+import time
+import queue
+import argparse
+import threading
+import urllib.request
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from src.detector import SeatDetector
+from src.utils import *
+from src.config import *
+
+
+class MJPEGCapture:
+    """
+    Minimal MJPEG-over-HTTP reader for IP webcam streams.
+
+    cv2.VideoCapture routes network streams through ffmpeg with its own
+    buffering; reading the multipart stream ourselves and handing each
+    raw JPEG straight to cv2.imdecode (libjpeg-turbo) skips a decode
+    layer and avoids frames piling up in the backend buffer.
+    Mirrors the small part of the VideoCapture API the main loop uses.
+    """
+
+    CHUNK_SIZE = 16384
+
+    def __init__(self, url):
+        try:
+            self.stream = urllib.request.urlopen(url, timeout=10)
+        except Exception as e:
+            print(f"✗ Could not open MJPEG stream: {e}")
+            self.stream = None
+        self.buffer = b''
+        self._pending = None
+
+    def isOpened(self):
+        return self.stream is not None
+
+    def grab(self):
+        """Advance to the next JPEG in the stream without decoding it"""
+        while True:
+            # Transient network errors are normal for a phone camera
+            # (timeouts, resets, the phone sleeping); treat them like
+            # end-of-stream so callers get the same ret=False shutdown
+            # path as a local VideoCapture losing its device
+            try:
+                chunk = self.stream.read(self.CHUNK_SIZE)
+            except Exception:
+                chunk = b''
+            if not chunk:
+                self._pending = None
+                return False
+            self.buffer += chunk
+
+            # Find one complete JPEG (SOI .. EOI markers)
+            start = self.buffer.find(b'\xff\xd8')
+            end = self.buffer.find(b'\xff\xd9', start + 2) if start != -1 else -1
+            if start != -1 and end != -1:
+                self._pending = self.buffer[start:end + 2]
+                self.buffer = self.buffer[end + 2:]
+                return True
+
+    def retrieve(self):
+        """Decode the last grabbed JPEG"""
+        if self._pending is None:
+            return False, None
+        frame = cv2.imdecode(np.frombuffer(self._pending, np.uint8),
+                             cv2.IMREAD_COLOR)
+        self._pending = None
+        return frame is not None, frame
+
+    def read(self):
+        """Return (ret, frame) with the next JPEG in the stream"""
+        if not self.grab():
+            return False, None
+        return self.retrieve()
+
+    def get(self, prop):
+        return 0  # stream dimensions are known after the first frame
+
+    def set(self, prop, value):
+        pass
+
+    def release(self):
+        if self.stream is not None:
+            try:
+                self.stream.close()
+            except Exception:
+                pass  # closing an already-dead socket can itself raise
+            self.stream = None
+
+
+def open_camera(source):
+    """Open a camera source: MJPEG reader for HTTP URLs, else VideoCapture"""
+    if isinstance(source, str) and source.startswith('http'):
+        return MJPEGCapture(source)
+    cap = cv2.VideoCapture(source)
+    cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)  # keep latency low on live streams
+    return cap
+
+
+def main(source=0, seat_zones_path=SEAT_ZONES_PATH, skip_frames=2,
+         save_snapshots=True, precision='fp32', snapshot_format='ppm',
+         adaptive_skip=False):
+    """Real-time detection from webcam or IP camera"""
+
+    # Create output directories
+    create_output_directories()
+
+    # Open camera (int index for local webcam, URL for IP camera)
+    print(f"\nConnecting to camera: {source}")
+    cap = open_camera(source)
+
+    if not cap.isOpened():
+        print(f"✗ Error: Could not connect to camera {source}")
+        return
+
+    width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+    height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+    if width and height:
+        print(f"✓ Camera connected: {width}x{height}")
+    else:
+        print("✓ Camera connected (MJPEG stream)")
+
+    # Load seat zones
+    print(f"\nLoading seat zones: {seat_zones_path}")
+    seat_zones = load_seat_zones(seat_zones_path)
+    print(f"✓ Loaded {len(seat_zones)} seat zones: {list(seat_zones.keys())}")
+
+    # Initialize detector
+    print("\nInitializing detector...")
+    detector = SeatDetector(use_tensorrt=(precision != 'fp32'),
+                            precision=precision)
+
+    cv2.namedWindow('Library Seat Detection - Live', cv2.WINDOW_NORMAL)
+
+    # Three-stage pipeline on dedicated threads (see detect_video.py),
+    # but with a drop-oldest capture queue: a live camera keeps producing
+    # whether we are ready or not, so when inference falls behind we keep
+    # only the newest frame instead of building up display latency.
+    frame_q = queue.Queue(maxsize=2)
+    result_q = queue.Queue(maxsize=2)
+    stop_event = threading.Event()
+    pause_event = threading.Event()
+
+    def capture_worker():
+        count = 0
+        # The sentinel must go out even if the worker dies unexpectedly,
+        # or the consumer blocks forever in queue.get()
+        try:
+            while not stop_event.is_set():
+                # grab() is cheap (no decode). While the pipeline is full
+                # we keep grabbing so the stream position stays at the
+                # newest frame, and never pay decode for frames we'd drop
+                # anyway -- this is what bounds end-to-end latency to ~1
+                # frame even on backends that ignore CAP_PROP_BUFFERSIZE.
+                if not cap.grab():
+                    break
+                if frame_q.full():
+                    continue
+                ret, frame = cap.retrieve()
+                if not ret:
+                    continue
+                count += 1
+                frame_q.put((count, frame))
+        finally:
+            frame_q.put(None)  # camera lost / stopped / worker failed
+
+    # Adaptive skip: EWMA of inference latency decides how many source
+    # frames one inference "costs" (see detect_video.py)
+    source_fps = cap.get(cv2.CAP_PROP_FPS) or 30.0
+    ema_latency = [0.0]
+
+    def adapt_skip(dt, current_skip, processed):
+        ema_latency[0] = (dt if ema_latency[0] == 0
+                          else 0.9 * ema_latency[0] + 0.1 * dt)
+        if processed % 30 != 0:
+            return current_skip
+        new_skip = max(1, math.ceil(ema_latency[0] * source_fps))
+        if new_skip != current_skip:
+            print(f"  Adaptive skip: {current_skip} -> {new_skip} "
+                  f"(inference {ema_latency[0] * 1000:.0f} ms)")
+        return new_skip
+
+    def infer_worker():
+        nonlocal skip_frames
+        last_detections, last_statuses = [], {}
+        processed = 0
+        try:
+            while True:
+                item = frame_q.get()
+                if item is None:
+                    break
+                idx, frame = item
+                # Run detection on every Nth frame, reuse last result otherwise
+                if not pause_event.is_set() and (idx - 1) % skip_frames == 0:
+                    t_before = time.time()
+                    last_detections, last_statuses = detector.process_image(frame, seat_zones)
+                    processed += 1
+                    if adaptive_skip:
+                        skip_frames = adapt_skip(time.time() - t_before,
+                                                 skip_frames, processed)
+                result_q.put((frame, last_detections, last_statuses))
+        finally:
+            result_q.put(None)  # always unblock the display loop
+
+    threading.Thread(target=capture_worker, daemon=True).start()
+    threading.Thread(target=infer_worker, daemon=True).start()
+
+    # Background writer so snapshot encode/flush never stalls the loop
+    snapshot_saver = ThreadPoolExecutor(max_workers=2)
+
+    fps_counter_start = time.time()
+    fps_frame_count = 0
+    current_fps = 0.0
+    paused = False
+    last_report_key = [None]
+    zone_overlay = SeatZoneOverlay(seat_zones)
+
+    print("\nLive detection running...")
+    print("Controls: 'q' = quit, 's' = save snapshot, 'p' = pause, 'r' = reset FPS")
+
+    while True:
+        item = result_q.get()
+        if item is None:
+            print("✗ Lost connection to camera")
+            break
+
+        frame, last_detections, last_statuses = item
+        fps_frame_count += 1
+
+        # Draw in-place: the pipeline hands us ownership of the frame
+        vis_frame = visualize_results(frame, seat_zones, last_statuses,
+                                      last_detections, out=frame,
+                                      overlay=zone_overlay)
+
+        # FPS counter (updated once per second)
+        elapsed = time.time() - fps_counter_start
+        if elapsed >= 1.0:
+            current_fps = fps_frame_count / elapsed
+            fps_counter_start = time.time()
+            fps_frame_count = 0
+
+        # Info overlay
+        status_text = "PAUSED" if paused else f"FPS: {current_fps:.1f}"
+        cv2.putText(vis_frame, status_text, (10, 30),
+                    cv2.FONT_HERSHEY_SIMPLEX, 0.8, (255, 255, 255), 2)
+
+        cv2.imshow('Library Seat Detection - Live', vis_frame)
+        key = cv2.waitKey(1) & 0xFF
+
+        if key == ord('q'):
+            print("\n✓ Stopped by user")
+            break
+        elif key == ord('p'):
+            paused = not paused
+            if paused:
+                pause_event.set()
+            else:
+                pause_event.clear()
+        elif key == ord('r'):
+            fps_counter_start = time.time()
+            fps_frame_count = 0
+        elif key == ord('s') and save_snapshots:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            # PPM is header + raw pixels (~3x faster than JPEG/PNG encode);
+            # the write runs on the saver thread so the loop never blocks
+            snapshot_path = Path(SNAPSHOT_DIR) / f"snapshot_{timestamp}.{snapshot_format}"
+            snapshot_saver.submit(cv2.imwrite, str(snapshot_path), vis_frame.copy())
+            # Skip the JSON report when statuses haven't changed since the
+            # last snapshot -- repeated 's' presses on a static room would
+            # just duplicate identical payloads
+            status_key = json.dumps(last_statuses, sort_keys=True)
+            if status_key != last_report_key[0]:
+                last_report_key[0] = status_key
+                json_path = Path(SNAPSHOT_DIR) / f"snapshot_{timestamp}.json"
+                snapshot_saver.submit(save_json_report, json_path,
+                                      snapshot_path.name, seat_zones,
+                                      last_statuses, last_detections)
+            print(f"✓ Snapshot queued: {snapshot_path}")
+
+    # Cleanup (finish pending snapshot writes, drain queues)
+    snapshot_saver.shutdown(wait=True)
+    stop_event.set()
+    for q in (frame_q, result_q):
+        while not q.empty():
+            try:
+                q.get_nowait()
+            except queue.Empty:
+                break
+    cap.release()
+    cv2.destroyAllWindows()
+    print("✓ Camera released")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Library Seat Detection - Webcam/IP Camera')
+    parser.add_argument('--source', type=str, default='0',
+                        help='Camera source: 0 for webcam, URL for IP camera')
+    parser.add_argument('--zones', type=str, default=SEAT_ZONES_PATH,
+                        help='Path to seat zones JSON file')
+    parser.add_argument('--skip-frames', type=int, default=2,
+                        help='Process every Nth frame (default: 2)')
+    parser.add_argument('--no-snapshots', action='store_true',
+                        help='Disable snapshot saving')
+    parser.add_argument('--snapshot-format', type=str, default='ppm',
+                        choices=['ppm', 'jpg', 'png'],
+                        help='Snapshot image format (ppm = fastest encode)')
+    parser.add_argument('--adaptive-skip', action='store_true',
+                        help='Adjust --skip-frames automatically from '
+                             'measured inference latency')
+    parser.add_argument('--precision', type=str, default='fp32',
+                        choices=['fp32', 'fp16', 'int8'],
+                        help='Inference precision (fp16/int8 need TensorRT)')
+
+    args = parser.parse_args()
+
+    # Numeric string means local webcam index
+    source = int(args.source) if args.source.isdigit() else args.source
+
+    main(source, args.zones, args.skip_frames,
+         save_snapshots=not args.no_snapshots, precision=args.precision,
+         snapshot_format=args.snapshot_format,
+         adaptive_skip=args.adaptive_skip)
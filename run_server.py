@@ -0,0 +1,327 @@
+"""
+Live detection server for the web dashboard.
+
+Captures a screen region (e.g. the Photo Booth window mirroring the
+library camera, same trick as tes.py), runs SeatDetector on it, and
+pushes seat status codes to Web/frontend over Socket.IO.
+
+Usage:
+    python run_server.py            # uses ROI from data/monitor_roi.json
+"""
+
+# eventlet must monkey-patch the stdlib before anything else imports
+# socket machinery. thread=False keeps threading.Thread a real OS
+# thread: the detection loop is CPU/GPU-bound and must not become a
+# greenlet that starves the event loop. Falls back to threading mode.
+try:
+    import eventlet
+    eventlet.monkey_patch(thread=False)
+    ASYNC_MODE = 'eventlet'
+except ImportError:
+    ASYNC_MODE = 'threading'
+
+import os
+
+# Pin the BLAS/OpenMP pools before numpy/cv2/torch create them: YOLO
+# owns the CPU budget here, and the default pools (one thread per core,
+# per library) oversubscribe against it and thrash on context switches
+os.environ.setdefault("OMP_NUM_THREADS", "2")
+os.environ.setdefault("OPENBLAS_NUM_THREADS", "2")
+os.environ.setdefault("MKL_NUM_THREADS", "2")
+
+import json
+import time
+import argparse
+import threading
+import webbrowser
+from datetime import datetime
+from pathlib import Path
+
+import cv2
+import mss
+import numpy as np
+from flask import Flask, send_from_directory
+from flask_socketio import SocketIO
+
+# OpenCV only does resize/cvtColor in this process; two threads are
+# plenty and the remaining cores stay free for inference
+cv2.setUseOptimized(True)
+cv2.setNumThreads(2)
+
+from src.detector import SeatDetector
+from src.preprocessing import ImagePreprocessor
+from src.seat_tracker import TemporalSmoother, STATUS_TO_INT
+from src.utils import load_seat_zones
+from src.config import *
+
+# Screen region to capture (created by setup_roi.py)
+MONITOR_ROI_PATH = "data/monitor_roi.json"
+
+# How often to run detection + push updates to clients
+UPDATE_RATE_FPS = 5
+
+# With coalesced emits, re-send an unchanged payload at most this often
+# so late-joining clients still get state quickly
+MIN_HEARTBEAT_S = 2.0
+
+# Status string -> code used by the frontend (see Web/frontend/js/main.js)
+STATUS_MAP = {
+    STATUS_OCCUPIED: 1,
+    STATUS_ON_HOLD: 2,
+    STATUS_EMPTY: 3
+}
+
+# Same mapping as an int-indexed LUT over the smoother's status codes,
+# so the hot loop does array reads instead of dict .get calls
+STATUS_LUT = np.empty(len(STATUS_TO_INT), np.int8)
+for _name, _code in STATUS_MAP.items():
+    STATUS_LUT[STATUS_TO_INT[_name]] = _code
+
+FRONTEND_DIR = Path(__file__).parent / "Web" / "frontend"
+
+# orjson is optional (same pattern as src/utils.py): Socket.IO accepts
+# any json-module lookalike, and orjson serializes payloads in C
+try:
+    import orjson
+
+    class OrJSON:
+        """json-module shim backed by orjson for Socket.IO payloads"""
+        @staticmethod
+        def dumps(obj, **kwargs):
+            return orjson.dumps(obj).decode()
+
+        @staticmethod
+        def loads(s, **kwargs):
+            return orjson.loads(s)
+
+    SOCKETIO_JSON = OrJSON
+except ImportError:
+    SOCKETIO_JSON = json
+
+app = Flask(__name__, static_folder=str(FRONTEND_DIR), static_url_path='')
+socketio = SocketIO(app, async_mode=ASYNC_MODE, cors_allowed_origins='*',
+                    json=SOCKETIO_JSON)
+
+# Shared state between the Flask thread and the detection thread
+detector = None
+smoother = None
+preprocessor = None
+seat_zones = None
+monitor_roi = None
+is_running = False
+
+# Latest-wins slot between the detection thread and the emitter task:
+# the detector overwrites it, the emitter drains it. A slow client can
+# only ever delay the freshest payload, never queue stale ones.
+pending_payload = [None]
+
+
+@app.route('/')
+def index():
+    return send_from_directory(str(FRONTEND_DIR), 'index.html')
+
+
+def load_monitor_roi(path=MONITOR_ROI_PATH):
+    """Load the capture region; fall back to the full primary monitor"""
+    if Path(path).exists():
+        with open(path, 'r') as f:
+            roi = json.load(f)
+        return {k: int(roi[k]) for k in ('left', 'top', 'width', 'height')}
+
+    print(f"⚠ No ROI file at {path}, capturing full primary monitor")
+    with mss.mss() as sct:
+        mon = sct.monitors[1]
+    return {'left': mon['left'], 'top': mon['top'],
+            'width': mon['width'], 'height': mon['height']}
+
+
+def detection_loop():
+    """Detect -> emit loop; capture runs on its own producer thread"""
+    global is_running
+
+    h, w = monitor_roi['height'], monitor_roi['width']
+
+    # Capture is decoupled from detection via a latest-frame-wins triple
+    # buffer: the producer grabs into 'write', publishes by swapping it
+    # with 'ready', and the detector swaps 'ready' into 'read' when it
+    # wants a frame. Only index variables move under the lock, so there
+    # are no copies, stale frames are dropped for free, and screen-grab
+    # latency (15-25 ms) no longer adds to every inference.
+    bufs = [np.empty((h, w, 3), np.uint8) for _ in range(3)]
+    idx = {'write': 0, 'ready': 1, 'read': 2, 'fresh': False}
+    buf_lock = threading.Lock()
+    frame_ready = threading.Event()
+
+    def capture_worker():
+        # mss instances are not thread-safe across threads; one per thread.
+        # np.frombuffer wraps the raw BGRA bytes without copying and
+        # cv2.cvtColor(dst=...) lands BGR straight in the reused buffer.
+        with mss.mss() as sct:
+            while is_running:
+                raw = sct.grab(monitor_roi)
+                bgra = np.frombuffer(raw.raw, dtype=np.uint8).reshape(
+                    raw.height, raw.width, 4)
+                cv2.cvtColor(bgra, cv2.COLOR_BGRA2BGR, dst=bufs[idx['write']])
+                with buf_lock:
+                    idx['write'], idx['ready'] = idx['ready'], idx['write']
+                    idx['fresh'] = True
+                frame_ready.set()
+
+    threading.Thread(target=capture_worker, daemon=True).start()
+
+    # Seat ids are fixed for the whole run: precompute the lower->UPPER
+    # names once and reuse one status_codes dict, overwriting values in
+    # place instead of rebuilding dicts/lists every frame (thousands of
+    # small allocations per second at streaming rates otherwise)
+    seat_ids_upper = {s: s.upper() for s in seat_zones}
+    status_codes = {u: 3 for u in seat_ids_upper.values()}
+    total_seats = len(status_codes)
+    seat_upper_names = [seat_ids_upper[s] for s in smoother.seat_ids]
+    raw_codes = np.empty(len(smoother.seat_ids), np.int8)
+    empty_code = STATUS_TO_INT[STATUS_EMPTY]
+    last_emitted_codes = None
+    last_emit_t = 0.0
+    occupied_count = 0
+
+    # Monotonic-deadline pacing: each iteration targets an absolute
+    # deadline instead of sleeping a wall-clock remainder, so scheduling
+    # jitter is absorbed into the next interval rather than accumulating
+    period = 1.0 / UPDATE_RATE_FPS
+    next_deadline = time.monotonic()
+
+    while is_running:
+        # STEP 1: take the newest complete frame
+        if not frame_ready.wait(timeout=1.0):
+            continue
+        frame_ready.clear()
+        with buf_lock:
+            if idx['fresh']:
+                idx['read'], idx['ready'] = idx['ready'], idx['read']
+                idx['fresh'] = False
+        frame = bufs[idx['read']]
+
+        # STEP 2: (optional) preprocessing, then detection. Static
+        # scenes stay cheap through the detector's own change gate
+        # (CHANGE_GATE_* in src/config.py) -- the single gate for all
+        # callers, which returns its cached result without a forward
+        # pass when the scene hasn't changed
+        if preprocessor is not None:
+            frame = preprocessor.process(frame)
+        detections, seat_statuses = detector.process_image(frame, seat_zones)
+
+        # STEP 3: temporal smoothing (majority vote over recent
+        # frames); statuses stay int-coded arrays end to end
+        for i, seat_id in enumerate(smoother.seat_ids):
+            raw_codes[i] = STATUS_TO_INT.get(
+                seat_statuses[seat_id]['status'], empty_code)
+        smoother.update(raw_codes)
+
+        # STEP 4: map the smoother's int statuses to frontend codes
+        # through the LUT (one indexed read, no dict .get per seat)
+        codes = STATUS_LUT[smoother.current]
+        occupied_count = int((codes == 1).sum())
+        for name, code in zip(seat_upper_names, codes):
+            status_codes[name] = int(code)
+
+        # STEP 5: publish only when something changed or a heartbeat is
+        # due; static frames cost zero serialization and zero emits
+        current = tuple(status_codes.values())
+        now = time.monotonic()
+        if current != last_emitted_codes or (now - last_emit_t) >= MIN_HEARTBEAT_S:
+            last_emitted_codes = current
+            last_emit_t = now
+            pending_payload[0] = {
+                'timestamp': datetime.now().strftime("%H:%M:%S"),
+                'status_codes': dict(status_codes),  # snapshot, we mutate it
+                'occupied': occupied_count,
+                'total_seats': total_seats
+            }
+
+        # Pace the loop to UPDATE_RATE_FPS against the deadline; if a
+        # slow frame put us behind, re-anchor instead of bursting to
+        # catch up
+        next_deadline += period
+        sleep_time = next_deadline - time.monotonic()
+        if sleep_time > 0:
+            time.sleep(sleep_time)
+        else:
+            next_deadline = time.monotonic()
+
+
+def emitter_loop():
+    """Background task draining the freshest payload to clients"""
+    while True:
+        payload = pending_payload[0]
+        if payload is not None:
+            pending_payload[0] = None
+            socketio.emit('status_update', payload)
+        socketio.sleep(0.05)
+
+
+def start_detection(precision='fp32'):
+    """Initialize everything and launch the detection thread"""
+    global detector, smoother, preprocessor, seat_zones, monitor_roi, is_running
+
+    print("[1/4] Loading seat zones...")
+    seat_zones = load_seat_zones(SEAT_ZONES_PATH)
+    print(f"      ✓ {len(seat_zones)} zones: {list(seat_zones.keys())}")
+
+    print("[2/4] Loading monitor ROI...")
+    monitor_roi = load_monitor_roi()
+    print(f"      ✓ {monitor_roi['width']}x{monitor_roi['height']} at "
+          f"({monitor_roi['left']}, {monitor_roi['top']})")
+
+    print("[3/4] Initializing YOLO detector...")
+    # fp16/int8 load a cached TensorRT engine (exported on first use);
+    # inference dominates the loop, so this is where the FPS comes from
+    detector = SeatDetector(use_tensorrt=(precision != 'fp32'),
+                            precision=precision)
+
+    # Warm up: the first inference pays cuDNN autotune / CUDA context /
+    # kernel JIT costs (easily 10-20x steady-state latency). Burn that
+    # on dummy frames at the real input shape before going live so the
+    # first frame clients see isn't a multi-second stall.
+    dummy = np.zeros((monitor_roi['height'], monitor_roi['width'], 3), np.uint8)
+    for _ in range(3):
+        detector.process_image(dummy, seat_zones)
+    print("      ✓ Warmed up (3 dummy inferences)")
+
+    smoother = TemporalSmoother(seat_zones.keys())
+
+    if PREPROCESSING_ENABLED:
+        preprocessor = ImagePreprocessor((monitor_roi['height'],
+                                          monitor_roi['width']))
+        print(f"      ✓ Preprocessing: {', '.join(preprocessor.features)}")
+
+    print("[4/4] Starting detection thread...")
+    is_running = True
+    threading.Thread(target=detection_loop, daemon=True).start()
+    socketio.start_background_task(emitter_loop)
+
+
+def open_browser_delayed(url, delay=2):
+    """Open the dashboard once the server has had time to bind"""
+    # socketio.sleep yields cooperatively under eventlet, so this never
+    # contends with the detection thread during model cold-start
+    socketio.sleep(delay)
+    webbrowser.open(url)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Library Seat Detection - Live Server')
+    parser.add_argument('--precision', type=str, default='fp32',
+                        choices=['fp32', 'fp16', 'int8'],
+                        help='Inference precision (fp16/int8 need TensorRT)')
+    args = parser.parse_args()
+
+    start_detection(args.precision)
+
+    url = "http://localhost:5000"
+    print(f"\n✓ Dashboard: {url}\n")
+    socketio.start_background_task(open_browser_delayed, url)
+
+    socketio.run(app, host='0.0.0.0', port=5000, allow_unsafe_werkzeug=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Interactive tool to pick the screen region run_server.py captures.
+
+Shows a live preview of the chosen monitor; drag a rectangle over the
+camera window (e.g. Photo Booth mirroring the library camera, same trick
+as tes.py) and press ENTER to save it to data/monitor_roi.json.
+
+One mss instance is created up front and reused for every grab in the
+preview loop: constructing mss.mss() per capture re-acquires OS display
+resources each time (and leaks DC handles on Windows), which alone can
+halve capture FPS.
+"""
+
+import json
+import argparse
+from pathlib import Path
+
+import cv2
+import mss
+import numpy as np
+
+MONITOR_ROI_PATH = "data/monitor_roi.json"
+PREVIEW_MAX_W = 1280
+WINDOW_NAME = "Select capture region"
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Select the monitor region for run_server.py')
+    parser.add_argument('--monitor', type=int, default=1,
+                        help='Monitor index (mss numbering, default: 1)')
+    parser.add_argument('--output', type=str, default=MONITOR_ROI_PATH,
+                        help='Where to save the ROI JSON')
+    args = parser.parse_args()
+
+    sel = {'start': None, 'end': None, 'dragging': False}
+
+    def on_mouse(event, x, y, flags, param):
+        if event == cv2.EVENT_LBUTTONDOWN:
+            sel['start'] = (x, y)
+            sel['end'] = (x, y)
+            sel['dragging'] = True
+        elif event == cv2.EVENT_MOUSEMOVE and sel['dragging']:
+            sel['end'] = (x, y)
+        elif event == cv2.EVENT_LBUTTONUP and sel['dragging']:
+            sel['end'] = (x, y)
+            sel['dragging'] = False
+
+    with mss.mss() as sct:
+        mon = sct.monitors[args.monitor]
+        scale = min(1.0, PREVIEW_MAX_W / mon['width'])
+        pw, ph = int(mon['width'] * scale), int(mon['height'] * scale)
+
+        # Reused per grab: full-size BGR + downscaled preview buffers
+        bgr = np.empty((mon['height'], mon['width'], 3), np.uint8)
+        preview = np.empty((ph, pw, 3), np.uint8)
+
+        cv2.namedWindow(WINDOW_NAME)
+        cv2.setMouseCallback(WINDOW_NAME, on_mouse)
+
+        print(f"Monitor {args.monitor}: {mon['width']}x{mon['height']}")
+        print("Drag a rectangle over the camera window.")
+        print("Controls: ENTER = save, 'r' = reset selection, 'q' = quit")
+
+        while True:
+            raw = sct.grab(mon)
+            bgra = np.frombuffer(raw.raw, dtype=np.uint8).reshape(
+                raw.height, raw.width, 4)
+            cv2.cvtColor(bgra, cv2.COLOR_BGRA2BGR, dst=bgr)
+            cv2.resize(bgr, (pw, ph), dst=preview)
+
+            if sel['start'] and sel['end']:
+                cv2.rectangle(preview, sel['start'], sel['end'],
+                              (0, 255, 0), 2)
+
+            cv2.imshow(WINDOW_NAME, preview)
+            key = cv2.waitKey(16) & 0xFF
+
+            if key == ord('q') or key == 27:
+                print("✗ Cancelled, nothing saved")
+                break
+            elif key == ord('r'):
+                sel['start'] = sel['end'] = None
+            elif key in (13, 32) and sel['start'] and sel['end']:
+                x1 = min(sel['start'][0], sel['end'][0])
+                y1 = min(sel['start'][1], sel['end'][1])
+                x2 = max(sel['start'][0], sel['end'][0])
+                y2 = max(sel['start'][1], sel['end'][1])
+                if x2 - x1 < 10 or y2 - y1 < 10:
+                    print("⚠ Selection too small, try again")
+                    continue
+
+                # Preview coords -> absolute screen coords
+                roi = {
+                    'left': mon['left'] + int(x1 / scale),
+                    'top': mon['top'] + int(y1 / scale),
+                    'width': int((x2 - x1) / scale),
+                    'height': int((y2 - y1) / scale)
+                }
+                Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+                with open(args.output, 'w') as f:
+                    json.dump(roi, f, indent=2)
+                print(f"✓ ROI saved to {args.output}: "
+                      f"{roi['width']}x{roi['height']} at "
+                      f"({roi['left']}, {roi['top']})")
+                break
+
+    cv2.destroyAllWindows()
+
+
+if __name__ == "__main__":
+    main()
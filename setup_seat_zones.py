@@ -0,0 +1,136 @@
+"""
+Interactive tool to define the seat zones in data/seat_zones.json.
+
+Freezes one frame (the run_server capture region by default, or an
+image via --image) and lets you drag one rectangle per seat id in a
+single persistent window with a mouse callback -- no cv2.selectROI,
+whose per-call window open/destroy cycle re-uploads the full frame for
+every seat and flickers. Accepted rectangles are painted once onto a
+cached canvas, so each interaction redraws only the rectangle being
+dragged instead of recomputing every zone from scratch.
+"""
+
+import json
+import argparse
+from pathlib import Path
+
+import cv2
+import mss
+import numpy as np
+
+from src.config import SEAT_ZONES_PATH
+
+MONITOR_ROI_PATH = "data/monitor_roi.json"
+DEFAULT_SEATS = "a1,a2,a3,b1,b2,b3"
+WINDOW_NAME = "Seat zone setup"
+
+
+def capture_base_frame():
+    """Grab one frame of the configured capture region (or full monitor)"""
+    with mss.mss() as sct:
+        if Path(MONITOR_ROI_PATH).exists():
+            with open(MONITOR_ROI_PATH, 'r') as f:
+                region = json.load(f)
+        else:
+            print(f"⚠ No ROI file at {MONITOR_ROI_PATH}, capturing full monitor")
+            region = sct.monitors[1]
+        raw = sct.grab(region)
+        bgra = np.frombuffer(raw.raw, dtype=np.uint8).reshape(
+            raw.height, raw.width, 4)
+        return cv2.cvtColor(bgra, cv2.COLOR_BGRA2BGR)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Define seat zones by dragging rectangles')
+    parser.add_argument('--image', type=str, default=None,
+                        help='Use an image file instead of a screen grab')
+    parser.add_argument('--seats', type=str, default=DEFAULT_SEATS,
+                        help='Comma-separated seat ids in drawing order')
+    parser.add_argument('--output', type=str, default=SEAT_ZONES_PATH,
+                        help='Where to save the zones JSON')
+    args = parser.parse_args()
+
+    seat_ids = [s.strip() for s in args.seats.split(',') if s.strip()]
+
+    if args.image:
+        frame = cv2.imread(args.image)
+        if frame is None:
+            print(f"✗ Could not read image: {args.image}")
+            return
+    else:
+        frame = capture_base_frame()
+    print(f"✓ Base frame: {frame.shape[1]}x{frame.shape[0]}")
+
+    # canvas carries the accepted rectangles; scratch is what we show,
+    # refreshed from canvas only while a drag is in progress
+    canvas = frame.copy()
+    scratch = canvas.copy()
+
+    sel = {'start': None, 'end': None, 'dragging': False}
+
+    def on_mouse(event, x, y, flags, param):
+        if event == cv2.EVENT_LBUTTONDOWN:
+            sel['start'] = (x, y)
+            sel['end'] = (x, y)
+            sel['dragging'] = True
+        elif event == cv2.EVENT_MOUSEMOVE and sel['dragging']:
+            sel['end'] = (x, y)
+        elif event == cv2.EVENT_LBUTTONUP and sel['dragging']:
+            sel['end'] = (x, y)
+            sel['dragging'] = False
+
+    cv2.namedWindow(WINDOW_NAME, cv2.WINDOW_AUTOSIZE)
+    cv2.setMouseCallback(WINDOW_NAME, on_mouse)
+
+    print(f"\nDrawing {len(seat_ids)} zones: {seat_ids}")
+    print("Controls: drag = select, ENTER = accept, 'r' = redo, 'q' = abort")
+
+    zones = {}
+    for seat_id in seat_ids:
+        print(f"\n[{seat_id.upper()}] drag the zone rectangle, then ENTER")
+        sel['start'] = sel['end'] = None
+
+        while True:
+            if sel['start'] and sel['end']:
+                np.copyto(scratch, canvas)
+                cv2.rectangle(scratch, sel['start'], sel['end'],
+                              (0, 255, 255), 2)
+                cv2.imshow(WINDOW_NAME, scratch)
+            else:
+                cv2.imshow(WINDOW_NAME, canvas)
+            key = cv2.waitKey(16) & 0xFF
+
+            if key == ord('q') or key == 27:
+                print("✗ Aborted, nothing saved")
+                cv2.destroyWindow(WINDOW_NAME)
+                return
+            elif key == ord('r'):
+                sel['start'] = sel['end'] = None
+            elif key in (13, 32) and sel['start'] and sel['end'] \
+                    and not sel['dragging']:
+                x1 = min(sel['start'][0], sel['end'][0])
+                y1 = min(sel['start'][1], sel['end'][1])
+                x2 = max(sel['start'][0], sel['end'][0])
+                y2 = max(sel['start'][1], sel['end'][1])
+                if x2 - x1 < 10 or y2 - y1 < 10:
+                    print("⚠ Selection too small, try again")
+                    continue
+
+                zones[seat_id] = {'x1': x1, 'y1': y1, 'x2': x2, 'y2': y2}
+                # Paint the accepted zone onto the cached canvas once
+                cv2.rectangle(canvas, (x1, y1), (x2, y2), (0, 255, 255), 2)
+                cv2.putText(canvas, seat_id.upper(), (x1 + 5, y1 + 25),
+                            cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 255, 255), 2)
+                print(f"  ✓ {seat_id}: ({x1}, {y1}) -> ({x2}, {y2})")
+                break
+
+    cv2.destroyWindow(WINDOW_NAME)
+
+    Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+    with open(args.output, 'w') as f:
+        json.dump(zones, f, indent=2)
+    print(f"\n✓ {len(zones)} zones saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
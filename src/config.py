@@ -5,6 +5,29 @@ YOLO_MODEL = "yolov8s.pt"  # Options: yolov8n.pt, yolov8s.pt, yolov8m.pt
 CONFIDENCE_THRESHOLD = 0.25  # Minimum confidence for detection
 IOU_THRESHOLD = 0.1  # Minimum IoU for object-seat mapping
 
+# Model input size (square) used for batched preprocessing
+YOLO_IMGSZ = 640
+
+# Frames per inference call for offline video processing. Batching
+# amortizes per-call overhead on GPU; keep at 1 for live/low-latency use
+BATCH_SIZE = 1
+
+# Inference backend configuration
+# When True, export the model to a TensorRT engine on first run and
+# reuse the cached .engine file afterwards. Falls back to PyTorch if
+# TensorRT is not available on this machine.
+USE_TENSORRT = False
+
+# Engine precision: "fp16" or "int8"
+# INT8 quantizes weights/activations using a calibration dataset and is
+# faster than FP16 on tensor cores; layers without INT8 kernels fall back
+# to FP16 automatically. Calibration results are cached with the engine.
+TENSORRT_PRECISION = "fp16"
+
+# Calibration data for INT8 export: dataset yaml or folder of
+# representative library images (a few hundred frames is enough)
+INT8_CALIBRATION_DATA = "data/test_images"
+
 # COCO Class IDs (from YOLO pretrained on COCO dataset)
 CLASS_PERSON = 0
 CLASS_BACKPACK = 24
@@ -44,6 +67,39 @@ CLASS_NAMES = {
     CLASS_CUP: "cup"
 }
 
+# Optional frame preprocessing before detection (src/preprocessing.py).
+# Stages run in list order; any of: "clahe", "histeq", "denoise", "sharpen"
+PREPROCESSING_ENABLED = False
+PREPROCESSING_FEATURES = ["clahe", "sharpen"]
+CLAHE_CLIP_LIMIT = 2.0
+CLAHE_TILE_SIZE = 8
+
+# Global brightness/contrast adjustment; 1.0 = unchanged. Both fuse
+# into a single 256-entry LUT pass when either differs from 1.0
+PREPROCESSING_BRIGHTNESS = 1.0
+PREPROCESSING_CONTRAST = 1.0
+
+# Unsharp strength; 1.0 = the standard 3x3 sharpening kernel. Folded
+# into the kernel at init, so any strength stays a one-pass filter
+PREPROCESSING_SHARPEN_STRENGTH = 1.0
+
+# Print the per-seat assignment breakdown every frame (debugging only;
+# stdout I/O and string formatting are expensive in the hot path)
+DEBUG_SEAT_ASSIGNMENT = False
+
+# Frame-difference change gate (SeatDetector.process_image): when the
+# mean absolute difference between a small grayscale thumbnail of the
+# frame and the previous one stays below the threshold, the scene is
+# considered unchanged and the cached result is returned without
+# running inference. This is the single gate for all callers --
+# run_server relies on it rather than keeping a second one of its own
+CHANGE_GATE_ENABLED = True
+CHANGE_GATE_THRESHOLD = 2.5
+
+# Temporal smoothing: a seat's reported status is the majority vote of
+# its last SMOOTHING_WINDOW detections (kills single-frame flicker)
+SMOOTHING_WINDOW = 5
+
 # Seat status definitions
 STATUS_OCCUPIED = "OCCUPIED"
 STATUS_ON_HOLD = "ON-HOLD"
@@ -63,7 +119,20 @@ DETECTION_COLORS = {
     CLASS_BOOK: (255, 0, 255),      # Magenta
 }
 
+# Dense id-indexed variants of CLASS_NAMES / DETECTION_COLORS for
+# per-detection hot paths: plain list indexing, no dict hashing
+# (80 COCO classes)
+CLASS_NAME_ARR = ['unknown'] * 80
+for _cid, _cname in CLASS_NAMES.items():
+    CLASS_NAME_ARR[_cid] = _cname
+
+DETECTION_COLOR_ARR = [(128, 128, 128)] * 80
+for _cid, _ccolor in DETECTION_COLORS.items():
+    DETECTION_COLOR_ARR[_cid] = _ccolor
+
 # Paths
 SEAT_ZONES_PATH = "data/seat_zones.json"
 OUTPUT_DIR = "outputs"
-ANNOTATED_DIR = "outputs/annotated_images"
\ No newline at end of file
+ANNOTATED_DIR = "outputs/annotated_images"
+ANNOTATED_VIDEO_DIR = "outputs/annotated_videos"
+SNAPSHOT_DIR = "outputs/snapshots"
\ No newline at end of file
@@ -0,0 +1,95 @@
+"""
+Temporal smoothing of seat statuses.
+
+A single noisy YOLO frame shouldn't flip a seat between OCCUPIED and
+EMPTY on the dashboard; each seat's status is majority-voted over a
+sliding window of recent frames. State lives in small contiguous int
+arrays (one ring buffer row + one count row per seat) so the per-frame
+update is one tight kernel call instead of per-seat deque juggling.
+"""
+
+import numpy as np
+from src.config import *
+
+# Numba is optional (same pattern as src/utils.py)
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Status string <-> small int codes (array indices)
+STATUS_TO_INT = {STATUS_OCCUPIED: 0, STATUS_ON_HOLD: 1, STATUS_EMPTY: 2}
+INT_TO_STATUS = (STATUS_OCCUPIED, STATUS_ON_HOLD, STATUS_EMPTY)
+N_STATUSES = 3
+
+
+def _smooth_update(ring, head, counts, raw, current):
+    """
+    One smoothing step for all seats: retire the outgoing ring slot from
+    the per-status counts, write the new raw statuses, and re-take the
+    majority vote per seat. Ties go to the lower code, so OCCUPIED wins
+    over ON-HOLD wins over EMPTY.
+    """
+    for i in range(ring.shape[0]):
+        old = ring[i, head]
+        if old >= 0:  # -1 marks a not-yet-filled slot
+            counts[i, old] -= 1
+        ring[i, head] = raw[i]
+        counts[i, raw[i]] += 1
+
+        best = 0
+        for s in range(1, counts.shape[1]):
+            if counts[i, s] > counts[i, best]:
+                best = s
+        current[i] = best
+
+
+if NUMBA_AVAILABLE:
+    _smooth_update = njit(cache=True)(_smooth_update)
+
+
+class TemporalSmoother:
+    def __init__(self, seat_ids, window_size=SMOOTHING_WINDOW):
+        """Majority-vote smoother over the last window_size frames"""
+        self.seat_ids = list(seat_ids)
+        self.window = window_size
+
+        n = len(self.seat_ids)
+        self.ring = np.full((n, window_size), -1, np.int8)
+        self.counts = np.zeros((n, N_STATUSES), np.int16)
+        self.current = np.full(n, STATUS_TO_INT[STATUS_EMPTY], np.int8)
+        self.head = 0
+
+        self._raw = np.empty(n, np.int8)  # reused per-frame input array
+        self._index = {s: i for i, s in enumerate(self.seat_ids)}
+
+        # Warm-compile so the first live frame doesn't pay the JIT cost
+        if NUMBA_AVAILABLE:
+            _smooth_update(self.ring.copy(), 0, self.counts.copy(),
+                           self.current.copy(), self.current.copy())
+
+    def update(self, raw_codes):
+        """
+        Push one frame of int-coded statuses (array in seat_ids order)
+        and return the smoothed codes -- a view of the internal array,
+        valid until the next call. No dicts or strings on this path.
+        """
+        _smooth_update(self.ring, self.head, self.counts,
+                       raw_codes, self.current)
+        self.head = (self.head + 1) % self.window
+        return self.current
+
+    def update_batch(self, raw_statuses):
+        """
+        Dict-of-strings wrapper around update() for callers that work
+        with {seat_id: status string}.
+        """
+        for seat_id, i in self._index.items():
+            self._raw[i] = STATUS_TO_INT.get(raw_statuses[seat_id],
+                                             STATUS_TO_INT[STATUS_EMPTY])
+
+        self.update(self._raw)
+
+        return {seat_id: INT_TO_STATUS[self.current[i]]
+                for seat_id, i in self._index.items()}
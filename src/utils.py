@@ -1,10 +1,101 @@
 import json
+import sys
 import cv2
 import numpy as np
 from datetime import datetime
 from pathlib import Path
 from src.config import *
 
+# Numba is optional: the JIT kernel is ~3x faster on the per-frame
+# detection-to-zone loops, but everything works without it
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# orjson is optional: ~5-10x faster report serialization than stdlib json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def assign_detections(overlap, is_person):
+        """
+        Priority assignment over the overlap matrix. Returns
+        (has_person, det_seat): has_person[j] flags zones containing a
+        person; det_seat[i] is the zone index detection i's object is
+        assigned to, preferring zones with a person, first-zone-wins
+        (-1 for persons and unassigned objects).
+        """
+        n, m = overlap.shape
+        has_person = np.zeros(m, np.bool_)
+        for i in range(n):
+            if is_person[i]:
+                for j in range(m):
+                    if overlap[i, j] > 0:
+                        has_person[j] = True
+
+        det_seat = np.full(n, -1, np.int32)
+        for i in range(n):
+            if not is_person[i]:
+                for j in range(m):
+                    if overlap[i, j] > 0 and has_person[j]:
+                        det_seat[i] = j
+                        break
+                if det_seat[i] == -1:
+                    for j in range(m):
+                        if overlap[i, j] > 0 and not has_person[j]:
+                            det_seat[i] = j
+                            break
+        return has_person, det_seat
+
+    @njit(cache=True, fastmath=True)
+    def compute_overlap_matrix(det_boxes, zone_boxes):
+        """
+        Pairwise intersection areas between detection and zone bboxes.
+        det_boxes: (N, 4) float32, zone_boxes: (M, 4) float32 [x1,y1,x2,y2]
+        Returns (N, M) float32 of intersection areas (0 = no overlap).
+        """
+        n = det_boxes.shape[0]
+        m = zone_boxes.shape[0]
+        out = np.zeros((n, m), dtype=np.float32)
+        for i in range(n):
+            for j in range(m):
+                w = (min(det_boxes[i, 2], zone_boxes[j, 2]) -
+                     max(det_boxes[i, 0], zone_boxes[j, 0]))
+                h = (min(det_boxes[i, 3], zone_boxes[j, 3]) -
+                     max(det_boxes[i, 1], zone_boxes[j, 1]))
+                if w > 0 and h > 0:
+                    out[i, j] = w * h
+        return out
+else:
+    def assign_detections(overlap, is_person):
+        """NumPy fallback for the priority assignment (same contract)"""
+        hits = overlap > 0
+        has_person = (hits & is_person[:, None]).any(axis=0)
+        obj_hits = hits & ~is_person[:, None]
+        pref = obj_hits & has_person
+        alt = obj_hits & ~has_person
+        use_pref = pref.any(axis=1)
+        use_alt = ~use_pref & alt.any(axis=1)
+        det_seat = np.full(overlap.shape[0], -1, np.int32)
+        det_seat[use_pref] = pref.argmax(axis=1)[use_pref]
+        det_seat[use_alt] = alt.argmax(axis=1)[use_alt]
+        return has_person, det_seat
+
+    def compute_overlap_matrix(det_boxes, zone_boxes):
+        """NumPy broadcast fallback for the overlap matrix (no numba)"""
+        w = (np.minimum(det_boxes[:, None, 2], zone_boxes[None, :, 2]) -
+             np.maximum(det_boxes[:, None, 0], zone_boxes[None, :, 0]))
+        h = (np.minimum(det_boxes[:, None, 3], zone_boxes[None, :, 3]) -
+             np.maximum(det_boxes[:, None, 1], zone_boxes[None, :, 1]))
+        return (np.maximum(w, 0) * np.maximum(h, 0)).astype(np.float32)
+
 
 def load_seat_zones(json_path):
     """Load seat zones from JSON file"""
@@ -100,25 +191,45 @@ def determine_seat_status(detections_in_seat):
         return STATUS_EMPTY
 
 
+# Status -> color lookup; anything unknown renders as EMPTY
+_STATUS_COLOR = {
+    STATUS_OCCUPIED: COLOR_OCCUPIED,
+    STATUS_ON_HOLD: COLOR_ON_HOLD,
+    STATUS_EMPTY: COLOR_EMPTY,
+}
+
+
 def get_status_color(status):
     """Get color for status visualization"""
-    if status == STATUS_OCCUPIED:
-        return COLOR_OCCUPIED
-    elif status == STATUS_ON_HOLD:
-        return COLOR_ON_HOLD
-    else:
-        return COLOR_EMPTY
+    return _STATUS_COLOR.get(status, COLOR_EMPTY)
+
+
+# Memoized cv2.getTextSize: labels repeat heavily frame to frame (seat
+# ids x statuses is a fixed set, class names x 2-decimal confidences a
+# small one), so the glyph measurement is computed once per unique label
+_TEXT_SIZE_CACHE = {}
+
+
+def _text_size(label, scale, thickness):
+    """cv2.getTextSize (FONT_HERSHEY_SIMPLEX) with memoization"""
+    key = (label, scale, thickness)
+    size = _TEXT_SIZE_CACHE.get(key)
+    if size is None:
+        size, _ = cv2.getTextSize(label, cv2.FONT_HERSHEY_SIMPLEX,
+                                  scale, thickness)
+        _TEXT_SIZE_CACHE[key] = size
+    return size
 
 
 def draw_bounding_box(image, box, label, color, thickness=2):
     """Draw bounding box with label on image"""
     x1, y1, x2, y2 = map(int, box)
-    
+
     # Draw rectangle
     cv2.rectangle(image, (x1, y1), (x2, y2), color, thickness)
-    
+
     # Draw label background
-    label_size, _ = cv2.getTextSize(label, cv2.FONT_HERSHEY_SIMPLEX, 0.6, 1)
+    label_size = _text_size(label, 0.6, 1)
     label_y = max(y1, label_size[1] + 10)
     cv2.rectangle(image, (x1, label_y - label_size[1] - 10), 
                   (x1 + label_size[0], label_y), color, -1)
@@ -130,24 +241,8 @@ def draw_bounding_box(image, box, label, color, thickness=2):
     return image
 
 
-def visualize_results(image, seat_zones, seat_statuses, all_detections):
-    """
-    Visualize detection results on image
-    """
-    vis_image = image.copy()
-    
-    # Draw all detections
-    for det in all_detections:
-        class_id = det['class_id']
-        bbox = det['bbox']
-        conf = det['confidence']
-        
-        color = DETECTION_COLORS.get(class_id, (128, 128, 128))
-        label = f"{CLASS_NAMES.get(class_id, 'unknown')} {conf:.2f}"
-        
-        vis_image = draw_bounding_box(vis_image, bbox, label, color, thickness=2)
-    
-    # Draw seat zones with status
+def draw_seat_zones(vis_image, seat_zones, seat_statuses):
+    """Draw seat-zone rectangles and status labels onto vis_image"""
     for seat_id, zone_bbox in seat_zones.items():
         status = seat_statuses.get(seat_id, {}).get('status', STATUS_EMPTY)
         color = get_status_color(status)
@@ -158,7 +253,7 @@ def visualize_results(image, seat_zones, seat_statuses, all_detections):
         
         # Draw status label
         label = f"{seat_id.upper()}: {status}"
-        label_size, _ = cv2.getTextSize(label, cv2.FONT_HERSHEY_SIMPLEX, 0.8, 2)
+        label_size = _text_size(label, 0.8, 2)
         
         # Position label at top of seat zone
         label_x = x1 + 5
@@ -173,10 +268,73 @@ def visualize_results(image, seat_zones, seat_statuses, all_detections):
         # Draw text
         cv2.putText(vis_image, label, (label_x, label_y),
                     cv2.FONT_HERSHEY_SIMPLEX, 0.8, (255, 255, 255), 2)
-    
+
     return vis_image
 
 
+class SeatZoneOverlay:
+    """
+    Cached seat-zone layer for streaming visualization.
+
+    Zone rectangles and status labels only change when a seat changes
+    status, yet the naive path re-issues ~4 OpenCV draw calls per seat
+    per frame. This caches the drawn layer plus a coverage mask and
+    composites it with one masked copy; the layer is redrawn only on a
+    status transition (rare at streaming rates).
+    """
+
+    def __init__(self, seat_zones):
+        self.seat_zones = seat_zones
+        self._key = None
+        self._layer = None
+        self._mask = None
+
+    def draw(self, vis_image, seat_statuses):
+        """Composite the (cached) zone layer onto vis_image in-place"""
+        key = tuple(seat_statuses.get(s, {}).get('status', STATUS_EMPTY)
+                    for s in self.seat_zones)
+        if key != self._key or (self._layer is not None
+                                and self._layer.shape != vis_image.shape):
+            if self._layer is None or self._layer.shape != vis_image.shape:
+                self._layer = np.zeros_like(vis_image)
+                self._mask = np.zeros(vis_image.shape[:2] + (1,), np.bool_)
+            else:
+                self._layer[:] = 0
+            draw_seat_zones(self._layer, self.seat_zones, seat_statuses)
+            np.any(self._layer, axis=2, keepdims=True, out=self._mask)
+            self._key = key
+        np.copyto(vis_image, self._layer, where=self._mask)
+        return vis_image
+
+
+def visualize_results(image, seat_zones, seat_statuses, all_detections,
+                      out=None, overlay=None):
+    """
+    Visualize detection results on image.
+    Pass out=image to draw in-place and skip the full-frame copy
+    (~6 MB per 1080p frame); by default the input is left untouched.
+    Pass a SeatZoneOverlay to composite a cached zone layer instead of
+    redrawing rectangles and labels every frame.
+    """
+    vis_image = image.copy() if out is None else out
+
+    # Draw all detections
+    for det in all_detections:
+        class_id = det['class_id']
+        bbox = det['bbox']
+        conf = det['confidence']
+
+        color = DETECTION_COLOR_ARR[class_id]
+        label = f"{CLASS_NAME_ARR[class_id]} {conf:.2f}"
+
+        vis_image = draw_bounding_box(vis_image, bbox, label, color, thickness=2)
+
+    # Draw seat zones with status (cached layer when an overlay is given)
+    if overlay is not None:
+        return overlay.draw(vis_image, seat_statuses)
+    return draw_seat_zones(vis_image, seat_zones, seat_statuses)
+
+
 def save_json_report(output_path, image_name, seat_zones, seat_statuses, all_detections):
     """Save detection results to JSON file"""
     # Calculate summary
@@ -204,62 +362,78 @@ def save_json_report(output_path, image_name, seat_zones, seat_statuses, all_det
         "total_detections": len(all_detections)
     }
     
-    # Save to file
-    with open(output_path, 'w') as f:
-        json.dump(report, f, indent=2)
-    
+    # Save to file (orjson serializes in C when available)
+    if ORJSON_AVAILABLE:
+        with open(output_path, 'wb') as f:
+            f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_path, 'w') as f:
+            json.dump(report, f, indent=2)
+
     return report
 
 
+# Status -> emoji lookup for the terminal report
+_STATUS_EMOJI = {
+    STATUS_OCCUPIED: "🟢",
+    STATUS_ON_HOLD: "🟡",
+    STATUS_EMPTY: "🔴",
+}
+
+
 def print_terminal_report(report):
-    """Print formatted report to terminal"""
-    print("\n" + "="*60)
-    print("        LIBRARY SEAT DETECTION SYSTEM")
-    print("="*60)
-    print(f"Image: {report['image_name']}")
-    print(f"Timestamp: {report['timestamp']}")
-    print("-"*60)
-    
-    print(f"\nTotal Detections: {report['total_detections']}")
-    print("-"*60)
-    
-    print("\nSeat Status Summary:")
-    print("-"*60)
+    """
+    Print formatted report to terminal.
+    The whole report is joined into one string and written with a single
+    stdout call -- print() flushes line-by-line on a tty, so ~25 prints
+    per report meant ~25 syscalls.
+    """
+    bar = "=" * 60
+    sep = "-" * 60
     summary = report['summary']
-    print(f"🟢 OCCUPIED:  {summary['occupied']} seats")
-    print(f"🟡 ON-HOLD:   {summary['on_hold']} seats")
-    print(f"🔴 EMPTY:     {summary['empty']} seats")
-    
-    print("\n" + "-"*60)
-    print("Detailed Status:")
-    print("-"*60)
-    
+
+    lines = [
+        "",
+        bar,
+        "        LIBRARY SEAT DETECTION SYSTEM",
+        bar,
+        f"Image: {report['image_name']}",
+        f"Timestamp: {report['timestamp']}",
+        sep,
+        "",
+        f"Total Detections: {report['total_detections']}",
+        sep,
+        "",
+        "Seat Status Summary:",
+        sep,
+        f"🟢 OCCUPIED:  {summary['occupied']} seats",
+        f"🟡 ON-HOLD:   {summary['on_hold']} seats",
+        f"🔴 EMPTY:     {summary['empty']} seats",
+        "",
+        sep,
+        "Detailed Status:",
+        sep,
+    ]
+
     for seat_id, data in report['seats'].items():
-        status = data['status']
-        
-        # Status emoji
-        if status == STATUS_OCCUPIED:
-            emoji = "🟢"
-        elif status == STATUS_ON_HOLD:
-            emoji = "🟡"
-        else:
-            emoji = "🔴"
-        
+        emoji = _STATUS_EMOJI.get(data['status'], "🔴")
+
         # Objects info
         objects = data['detected_objects']
         if len(objects) > 0:
-            obj_info = f"{objects[0]['class']} (conf: {objects[0]['confidence']:.2f})"
+            obj_info = f"{objects[0]['class_name']} (conf: {objects[0]['confidence']:.2f})"
         else:
             obj_info = "No objects detected"
-        
-        print(f"[{seat_id.upper()}] {emoji} {status:10s} - {obj_info}")
-    
-    print("\n" + "="*60)
-    print("✓ Results saved successfully")
-    print("="*60 + "\n")
+
+        lines.append(f"[{seat_id.upper()}] {emoji} {data['status']:10s} - {obj_info}")
+
+    lines += ["", bar, "✓ Results saved successfully", bar, "", ""]
+    sys.stdout.write("\n".join(lines))
 
 
 def create_output_directories():
     """Create output directories if they don't exist"""
     Path(OUTPUT_DIR).mkdir(parents=True, exist_ok=True)
-    Path(ANNOTATED_DIR).mkdir(parents=True, exist_ok=True)
\ No newline at end of file
+    Path(ANNOTATED_DIR).mkdir(parents=True, exist_ok=True)
+    Path(ANNOTATED_VIDEO_DIR).mkdir(parents=True, exist_ok=True)
+    Path(SNAPSHOT_DIR).mkdir(parents=True, exist_ok=True)
\ No newline at end of file
@@ -0,0 +1,357 @@
+"""
+Visual check that saved seat zones line up with the capture region.
+
+Overlays every zone from data/seat_zones.json on the captured screen
+region (single snapshot or a continuous live preview) so misaligned
+zones are obvious before starting run_server.py. Complements
+setup_seat_zones.py, which creates the zones; this tool only shows them.
+
+One mss instance is created at init and reused for every grab:
+constructing mss.mss() per capture re-acquires OS display resources
+each time, and each frame is wrapped zero-copy with np.frombuffer
+instead of np.array's full BGRA buffer promotion (~32 MB per 4K frame).
+"""
+
+import json
+import argparse
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+import cv2
+import mss
+import numpy as np
+
+from src.config import *
+from src.utils import load_seat_zones
+
+MONITOR_ROI_PATH = "data/monitor_roi.json"
+WINDOW_NAME = "Zone verification"
+
+# Corner tick length in pixels
+CORNER_SIZE = 20
+
+# Per-seat overlay palette (BGR), cycled when there are more seats
+ZONE_PALETTE = [
+    (0, 255, 255),   # Yellow
+    (255, 255, 0),   # Cyan
+    (255, 0, 255),   # Magenta
+    (0, 255, 0),     # Green
+    (0, 165, 255),   # Orange
+    (255, 128, 0),   # Light blue
+]
+
+
+class ZoneVerifier:
+    """Overlays the configured seat zones on live screen captures"""
+
+    def __init__(self, seat_zones_path=SEAT_ZONES_PATH,
+                 roi_path=MONITOR_ROI_PATH, monitor=1):
+        self._sct = mss.mss()
+        self.monitor = monitor
+        self.load_config(seat_zones_path, roi_path)
+
+        # Created once here so the snapshot hot key never pays the
+        # stat/mkdir syscalls per save
+        self._snap_dir = Path(SNAPSHOT_DIR)
+        self._snap_dir.mkdir(parents=True, exist_ok=True)
+
+    def load_config(self, seat_zones_path, roi_path):
+        """Load seat zones and the capture ROI (full monitor fallback)"""
+        self.seat_zones = load_seat_zones(seat_zones_path)
+        print(f"✓ {len(self.seat_zones)} zones loaded: "
+              f"{list(self.seat_zones.keys())}")
+
+        if Path(roi_path).exists():
+            with open(roi_path, 'r') as f:
+                self.roi = json.load(f)
+            print(f"✓ Capture ROI: {self.roi['width']}x{self.roi['height']} "
+                  f"at ({self.roi['left']}, {self.roi['top']})")
+        else:
+            self.roi = self._sct.monitors[self.monitor]
+            print(f"⚠ No ROI file at {roi_path}, "
+                  f"using full monitor {self.monitor}")
+
+        self.colors = {
+            seat_id: ZONE_PALETTE[i % len(ZONE_PALETTE)]
+            for i, seat_id in enumerate(self.seat_zones)
+        }
+
+        # SoA view of the zones: ids alongside an (N, 4) coordinate
+        # array, so derived geometry (sizes, centers) is one vector op
+        self._zone_ids = list(self.seat_zones.keys())
+        self._zones_arr = np.array(
+            [self.seat_zones[s] for s in self._zone_ids], dtype=np.int32)
+
+        # One writable BGR canvas reused for every frame: the frombuffer
+        # view over mss's raw bytes is read-only, so one copy into a
+        # preallocated buffer is the minimum -- and drawing then happens
+        # in place instead of paying a second full-frame copy
+        self._canvas = np.empty((self.roi['height'], self.roi['width'], 3),
+                                np.uint8)
+
+        # Zones never move while the tool runs, so every derived draw
+        # coordinate (rect corners, label background, text origin,
+        # corner tick endpoints) is computed once here; the per-frame
+        # loop only issues the OpenCV calls
+        self._draw_cache = []
+        for seat_id, bbox in self.seat_zones.items():
+            color = self.colors[seat_id]
+            x1, y1, x2, y2 = map(int, bbox)
+
+            label = seat_id.upper()
+            (tw, th), _ = cv2.getTextSize(label, cv2.FONT_HERSHEY_SIMPLEX,
+                                          0.8, 2)
+
+            # The 8 corner ticks as one (8, 2, 2) segment array so the
+            # per-frame path draws them with a single cv2.polylines call
+            # instead of 8 cv2.line round trips
+            cs = min(CORNER_SIZE, (x2 - x1) // 2, (y2 - y1) // 2)
+            corner_segs = np.array([
+                [[x1, y1], [x1 + cs, y1]], [[x1, y1], [x1, y1 + cs]],
+                [[x2, y1], [x2 - cs, y1]], [[x2, y1], [x2, y1 + cs]],
+                [[x1, y2], [x1 + cs, y2]], [[x1, y2], [x1, y2 - cs]],
+                [[x2, y2], [x2 - cs, y2]], [[x2, y2], [x2, y2 - cs]],
+            ], dtype=np.int32)
+
+            self._draw_cache.append((
+                color, (x1, y1), (x2, y2),
+                (x1, y1 - th - 12), (x1 + tw + 10, y1),
+                (x1 + 5, y1 - 6), label, corner_segs,
+            ))
+
+        self._build_overlay(self.roi['height'], self.roi['width'])
+
+    def _build_overlay(self, h, w):
+        """
+        Pre-render the static zone layer once. The zones never change
+        while the tool runs, so per-frame drawing reduces to one masked
+        blit of this layer instead of ~4 draw calls per zone. The mask
+        is drawn alongside the layer (not derived from nonzero pixels)
+        so black label text stays opaque.
+        """
+        self._overlay = np.zeros((h, w, 3), np.uint8)
+        self._mask = np.zeros((h, w), np.uint8)
+
+        # Geometry stays LINE_8 (mask must cover exactly the same
+        # pixels, and AA edges would bleed outside it); the labels get
+        # LINE_AA for readability -- rasterized once here, the smoother
+        # glyphs cost nothing per frame
+        for (color, p1, p2, bg1, bg2, text_org, label,
+             corner_segs) in self._draw_cache:
+            cv2.rectangle(self._overlay, p1, p2, color, 2,
+                          lineType=cv2.LINE_8)
+            cv2.rectangle(self._overlay, bg1, bg2, color, -1,
+                          lineType=cv2.LINE_8)
+            cv2.putText(self._overlay, label, text_org,
+                        cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 0, 0), 2,
+                        lineType=cv2.LINE_AA)
+            cv2.polylines(self._overlay, corner_segs, False, color, 3,
+                          lineType=cv2.LINE_8)
+
+            cv2.rectangle(self._mask, p1, p2, 255, 2, lineType=cv2.LINE_8)
+            cv2.rectangle(self._mask, bg1, bg2, 255, -1,
+                          lineType=cv2.LINE_8)
+            cv2.polylines(self._mask, corner_segs, False, 255, 3,
+                          lineType=cv2.LINE_8)
+
+    def print_zone_info(self):
+        """Print each zone's extent, size and center"""
+        arr = self._zones_arr
+        w = arr[:, 2] - arr[:, 0]
+        h = arr[:, 3] - arr[:, 1]
+        cx = (arr[:, 0] + arr[:, 2]) // 2
+        cy = (arr[:, 1] + arr[:, 3]) // 2
+
+        print("-" * 60)
+        for i, seat_id in enumerate(self._zone_ids):
+            print(f"[{seat_id.upper()}] "
+                  f"({arr[i, 0]}, {arr[i, 1]}) -> ({arr[i, 2]}, {arr[i, 3]})"
+                  f"  {w[i]}x{h[i]}, center ({cx[i]}, {cy[i]})")
+        print("-" * 60)
+
+    def capture_frame(self):
+        """
+        Grab one frame from the ROI into the reusable BGR canvas.
+        The returned array is the internal buffer, overwritten by the
+        next call; draw_zones draws on it in place.
+        """
+        shot = self._sct.grab(self.roi)
+        # HiDPI displays can return more pixels than the ROI asked for;
+        # resize the canvas (and re-render the overlay) once if so
+        if self._canvas.shape[:2] != (shot.height, shot.width):
+            self._canvas = np.empty((shot.height, shot.width, 3), np.uint8)
+            self._build_overlay(shot.height, shot.width)
+        bgra = np.frombuffer(shot.raw, dtype=np.uint8).reshape(
+            shot.height, shot.width, 4)
+        # cvtColor's SIMD channel strip beats np.copyto from the strided
+        # [:, :, :3] view; same pattern as run_server's capture worker
+        cv2.cvtColor(bgra, cv2.COLOR_BGRA2BGR, dst=self._canvas)
+        return self._canvas
+
+    def draw_zones(self, frame):
+        """Composite the pre-rendered zone layer onto frame in place"""
+        cv2.copyTo(self._overlay, self._mask, frame)
+        return frame
+
+    def run_single(self, output_path=None):
+        """Capture one frame, overlay the zones, show (and save) it"""
+        vis_frame = self.draw_zones(self.capture_frame())
+
+        if output_path:
+            Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+            cv2.imwrite(output_path, vis_frame)
+            print(f"✓ Snapshot saved to {output_path}")
+
+        print("Press any key to close")
+        cv2.imshow(WINDOW_NAME, vis_frame)
+        cv2.waitKey(0)
+        cv2.destroyAllWindows()
+
+    def run_continuous(self, fps=10):
+        """Live preview with the zones overlaid until 'q' is pressed"""
+        print(f"Live preview at {fps} FPS ('q' = quit, 's' = snapshot)")
+
+        # Capture runs on its own thread so sct.grab overlaps imshow and
+        # waitKey (all three spend their time in GIL-releasing C code).
+        # Three swap buffers, same scheme as run_server: the worker
+        # writes one, one holds the newest complete frame, and the main
+        # loop owns the one it is drawing on
+        bufs = [np.empty_like(self._canvas) for _ in range(3)]
+        idx = {'write': 0, 'ready': 1, 'read': 2, 'fresh': False}
+        buf_lock = threading.Lock()
+        frame_ready = threading.Event()
+        running = [True]
+
+        def capture_worker():
+            # mss instances are not thread-safe; the worker gets its own
+            with mss.mss() as sct:
+                while running[0]:
+                    shot = sct.grab(self.roi)
+                    buf = bufs[idx['write']]
+                    if buf.shape[:2] != (shot.height, shot.width):
+                        buf = np.empty((shot.height, shot.width, 3),
+                                       np.uint8)
+                        bufs[idx['write']] = buf
+                    bgra = np.frombuffer(shot.raw, dtype=np.uint8).reshape(
+                        shot.height, shot.width, 4)
+                    cv2.cvtColor(bgra, cv2.COLOR_BGRA2BGR, dst=buf)
+                    with buf_lock:
+                        idx['write'], idx['ready'] = (idx['ready'],
+                                                      idx['write'])
+                        idx['fresh'] = True
+                    frame_ready.set()
+
+        threading.Thread(target=capture_worker, daemon=True).start()
+
+        # Pace against a monotonic deadline, using waitKey as the sleep:
+        # a fixed waitKey(1000/fps) would add the capture+draw time on
+        # top of the interval every frame and drift below the target
+        # rate; here the remaining budget is slept, re-anchoring if a
+        # slow frame overruns it
+        period = 1.0 / fps
+        next_deadline = time.monotonic()
+
+        # The header string only changes once per second; reformat it
+        # then instead of paying strftime + f-string every frame
+        ts_sec = 0
+        header = ""
+
+        # Static-scene gate: when a subsampled slice of the frame is
+        # byte-identical to the previous one (idle library scene),
+        # the composite and imshow are skipped entirely and the loop
+        # just services keys -- the window already shows this frame
+        prev_sample = None
+        vis_frame = None
+
+        while True:
+            if not frame_ready.wait(timeout=1.0):
+                continue
+            frame_ready.clear()
+            with buf_lock:
+                if idx['fresh']:
+                    idx['read'], idx['ready'] = idx['ready'], idx['read']
+                    idx['fresh'] = False
+            frame = bufs[idx['read']]
+
+            sample = frame[::32, ::32]
+            changed = (prev_sample is None
+                       or prev_sample.shape != sample.shape
+                       or not np.array_equal(sample, prev_sample))
+            if changed:
+                if (prev_sample is None
+                        or prev_sample.shape != sample.shape):
+                    prev_sample = sample.copy()
+                else:
+                    np.copyto(prev_sample, sample)
+
+                if self._overlay.shape[:2] != frame.shape[:2]:
+                    self._build_overlay(*frame.shape[:2])
+                vis_frame = self.draw_zones(frame)
+
+                sec = int(time.time())
+                if sec != ts_sec:
+                    ts_sec = sec
+                    header = ("Zone verification  "
+                              + datetime.fromtimestamp(sec).strftime(
+                                  "%H:%M:%S"))
+                cv2.putText(vis_frame, header,
+                            (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 0.8,
+                            (255, 255, 255), 2, lineType=cv2.LINE_AA)
+
+                cv2.imshow(WINDOW_NAME, vis_frame)
+
+            next_deadline += period
+            sleep_ms = int((next_deadline - time.monotonic()) * 1000)
+            if sleep_ms <= 0:
+                next_deadline = time.monotonic()
+            key = cv2.waitKey(max(1, sleep_ms)) & 0xFF
+            if key == ord('q') or key == 27:
+                break
+            elif key == ord('s') and vis_frame is not None:
+                snap_path = self._snap_dir / f"zones_{int(time.time())}.jpg"
+                # Encode explicitly and dump the buffer straight to
+                # disk: skips imwrite's path-based codec dispatch and
+                # pins the JPEG quality instead of the codec default
+                ok, buf = cv2.imencode('.jpg', vis_frame,
+                                       [int(cv2.IMWRITE_JPEG_QUALITY), 85])
+                if ok:
+                    buf.tofile(str(snap_path))
+                    print(f"✓ Snapshot saved to {snap_path}")
+                else:
+                    print("✗ Snapshot encode failed")
+
+        running[0] = False
+        cv2.destroyAllWindows()
+
+    def close(self):
+        self._sct.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Overlay configured seat zones on the capture region')
+    parser.add_argument('--continuous', action='store_true',
+                        help='Live preview instead of a single snapshot')
+    parser.add_argument('--fps', type=int, default=10,
+                        help='Preview refresh rate (continuous mode)')
+    parser.add_argument('--output', type=str, default=None,
+                        help='Save the single-shot overlay to this path')
+    parser.add_argument('--monitor', type=int, default=1,
+                        help='Monitor index when no ROI file exists')
+    args = parser.parse_args()
+
+    verifier = ZoneVerifier(monitor=args.monitor)
+    verifier.print_zone_info()
+    try:
+        if args.continuous:
+            verifier.run_continuous(fps=args.fps)
+        else:
+            verifier.run_single(output_path=args.output)
+    finally:
+        verifier.close()
+
+
+if __name__ == "__main__":
+    main()